@@ -36,17 +36,7 @@ class MySQLCreateTable(DatabaseCreateStatement):
 
         # Iterate through each row in the column
         for row in column_rows:
-
-            # Get the MySQL data type
-            col_type = self.data_type(row, col_type)
-
-            # Calculate width if a varchar
-            if col_type == "varchar":
-                row_width = len(str(row.encode("utf-8")))
-
-                # Evaluate width vs. current max width
-                if row_width > col_width:
-                    col_width = row_width
+            col_type, col_width = self._evaluate_value(row, col_type, col_width)
 
         return col_type, col_width
 
@@ -54,39 +44,72 @@ class MySQLCreateTable(DatabaseCreateStatement):
         # Generate a dict of MySQL column types and widths for all columns
         # in a table.
 
-        table_map = []
+        # Evaluate every column in one pass over the rows, reading the header
+        # (which ``tbl.columns`` re-reads on each access) only once.
+        columns = tbl.columns
+        col_types = [None] * len(columns)
+        col_widths = [0] * len(columns)
+
+        for row in tbl.data:
+            for i, val in enumerate(row[: len(columns)]):
+                col_types[i], col_widths[i] = self._evaluate_value(
+                    val, col_types[i], col_widths[i]
+                )
+
+        return [
+            {"name": col, "type": col_type, "width": col_width}
+            for col, col_type, col_width in zip(columns, col_types, col_widths)
+        ]
+
+    def _evaluate_value(self, val, col_type, col_width):
+        # Update a column's MySQL data type and width with a single value.
+
+        # Get the MySQL data type
+        col_type = self.data_type(val, col_type)
 
-        for col in tbl.columns:
-            col_type, col_width = self.evaluate_column(tbl.column_data(col))
-            col_map = {"name": col, "type": col_type, "width": col_width}
-            table_map.append(col_map)
+        # Calculate width if a varchar
+        if col_type == "varchar":
+            row_width = len(str(val.encode("utf-8")))
 
-        return table_map
+            # Evaluate width vs. current max width
+            if row_width > col_width:
+                col_width = row_width
+
+        return col_type, col_width
 
     def create_statement(self, tbl, table_name, strict_length=True):
         # Generate create statement SQL for a given Parsons table.
 
-        # Validate and rename column names if needed
-        tbl.table = petl.setheader(tbl.table, self.columns_convert(tbl.columns))
+        # Validate and rename column names if needed. Skip the rename when the
+        # columns are already valid, so petl does not have to rewrite the table.
+        columns = self.columns_convert(tbl.columns)
+        if columns != list(tbl.columns):
+            tbl.table = petl.setheader(tbl.table, columns)
 
         # Generate the table map
         table_map = self.evaluate_table(tbl)
 
         # Generate the column syntax
-        column_syntax = []
-        for c in table_map:
-            if strict_length:
-                col_width = int(c["width"] + (self.VARCHAR_PAD * c["width"]))
-            else:
-                col_width = self.round_longest(c["width"])
-
-            if c["type"] == "varchar":
-                column_syntax.append(f"{c['name']} {c['type']}({col_width}) \n")
-            else:
-                column_syntax.append(f"{c['name']} {c['type']} \n")
+        column_syntax = ",".join(
+            f"{c['name']} {self._column_type(c, strict_length)} \n" for c in table_map
+        )
 
         # Generate full statement
-        return f"CREATE TABLE {table_name} ( \n {','.join(column_syntax)});"
+        return f"CREATE TABLE {table_name} ( \n {column_syntax});"
+
+    def _column_type(self, col_map, strict_length):
+        # Generate the column type for a column in the table map, sizing varchars
+        # to fit the column's widest value.
+
+        if col_map["type"] != "varchar":
+            return col_map["type"]
+
+        if strict_length:
+            col_width = int(col_map["width"] + (self.VARCHAR_PAD * col_map["width"]))
+        else:
+            col_width = self.round_longest(col_map["width"])
+
+        return f"{col_map['type']}({col_width})"
 
     # This is for backwards compatability
     def columns_convert(self, columns):
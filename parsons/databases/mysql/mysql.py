@@ -17,6 +17,10 @@ from parsons.databases.alchemy import Alchemy
 # 100k rows per batch at ~1k bytes each = ~100MB per batch.
 QUERY_BATCH_SIZE = 100000
 
+# Write buffer used when pickling query results to a temp file, so that the
+# many small per-row pickles are flushed to disk in large blocks.
+PICKLE_BUFFER_SIZE = 1 << 20
+
 logger = logging.getLogger(__name__)
 
 
@@ -171,11 +175,13 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
                 # Fetch the data in batches, and "pickle" the rows to a temp file.
                 # (We pickle rather than writing to, say, a CSV, so that we maintain
                 # all the type information for each field.)
+                # Rows are pickled one at a time, since ``petl.frompickle`` reads
+                # the file back one object per row.
                 temp_file = files.create_temp_file()
 
-                with open(temp_file, "wb") as f:
+                with open(temp_file, "wb", buffering=PICKLE_BUFFER_SIZE) as f:
                     # Grab the header
-                    pickle.dump(cursor.column_names, f)
+                    pickle.dump(cursor.column_names, f, protocol=pickle.HIGHEST_PROTOCOL)
 
                     while True:
                         batch = cursor.fetchmany(QUERY_BATCH_SIZE)
@@ -184,7 +190,7 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
 
                         logger.debug(f"Fetched {len(batch)} rows.")
                         for row in batch:
-                            pickle.dump(row, f)
+                            pickle.dump(row, f, protocol=pickle.HIGHEST_PROTOCOL)
 
                 # Load a Table from the file
                 final_tbl = Table(petl.frompickle(temp_file))
@@ -238,29 +244,33 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
                 self.query_with_connection(sql, connection, commit=False)
                 logger.info(f"Table {table_name} created.")
 
+            # Every chunk shares the same columns, so the insert statement only
+            # needs to be generated once.
+            sql = self._insert_statement(tbl, table_name)
+
             # Chunk tables in batches of 1K rows, though this can be tuned and
             # optimized further.
-            for t in tbl.chunk(chunk_size):
-                sql = self._insert_statement(t, table_name)
-                self.query_with_connection(sql, connection, commit=False)
+            with self.cursor(connection) as cursor:
+                for t in tbl.chunk(chunk_size):
+                    # The C extension cursor only accepts a list or tuple of rows,
+                    # not a lazy petl view.
+                    rows = list(t.data)
+                    logger.debug(f"Inserting {len(rows)} rows into {table_name}.")
+                    cursor.executemany(sql, rows)
 
     def _insert_statement(self, tbl, table_name):
         """
-        Convert the table data into a string for bulk importing.
+        Generate a parameterized insert statement for the table's columns. The
+        connector expands it into a single extended insert when passed to
+        ``cursor.executemany``, escaping each value along the way.
         """
 
-        # Single column tables
-        if len(tbl.columns) == 1:
-            values = [f"({row[0]})" for row in tbl.data]
-
-        # Multi-column tables
-        else:
-            values = [str(row) for row in tbl.data]
+        placeholders = ",".join(["%s"] * len(tbl.columns))
 
         # Create full insert statement
         sql = f"""INSERT INTO {table_name}
                   ({','.join(tbl.columns)})
-                  VALUES {",".join(values)};"""
+                  VALUES ({placeholders})"""
 
         return sql
 
@@ -285,7 +295,7 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
             raise ValueError("Invalid value for `if_exists` argument")
 
         # If the table exists, evaluate the if_exists argument for next steps.
-        if self.table_exists(table_name):
+        if self.table_exists_with_connection(table_name, connection):
             if if_exists == "fail":
                 raise ValueError("Table already exists.")
 
@@ -310,17 +320,33 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
 
         `Args:`
             table_name: str
-                The table name
+                The table name, optionally qualified with its database
+                (e.g. ``my_schema.my_table``). Unqualified names are looked up
+                in the connection's database.
 
         `Returns:`
             boolean
                 ``True`` if the table exists and ``False`` if it does not.
         """
 
-        if self.query(f"SHOW TABLES LIKE '{table_name}'").first == table_name:
-            return True
-        else:
-            return False
+        with self.connection() as connection:
+            return self.table_exists_with_connection(table_name, connection)
+
+    def table_exists_with_connection(self, table_name, connection):
+
+        # In MySQL a "schema" is a database, so a qualified name is split into
+        # the database and table to look up. Otherwise fall back to ``DATABASE()``.
+        schema, _, table = table_name.rpartition(".")
+
+        # Look the name up directly rather than through ``query``, which would
+        # spool the (at most one row) result to a temp file. Binding the name as
+        # a parameter also avoids ``LIKE`` treating ``_`` and ``%`` as wildcards.
+        sql = """SELECT 1 FROM information_schema.tables
+                 WHERE table_schema = COALESCE(%s, DATABASE()) AND table_name = %s"""
+
+        with self.cursor(connection) as cursor:
+            cursor.execute(sql, (schema or None, table))
+            return cursor.fetchone() is not None
 
     def table(self, table_name):
         # Return a BaseTable table object
@@ -1,7 +1,11 @@
 from parsons import MySQL, Table
 from parsons.databases.mysql.create_table import MySQLCreateTable
 from test.utils import assert_matching_tables
+import petl
 import unittest
+from unittest.mock import MagicMock, patch
+from mysql.connector.conversion import MySQLConverter
+from mysql.connector.cursor import MySQLCursor
 import os
 
 
@@ -190,7 +194,132 @@ class TestMySQL(unittest.TestCase):  # noqa
         ]
         self.assertEqual(self.mysql.evaluate_table(self.tbl), table_map)
 
+    def test_evaluate_table_single_pass(self):
+
+        class CountingTable(petl.Table):
+            # A lazy petl table that counts how many times it is iterated
+            def __init__(self, rows):
+                self.rows = rows
+                self.iterations = 0
+
+            def __iter__(self):
+                self.iterations += 1
+                return iter(self.rows)
+
+        source = CountingTable(
+            [["ID", "Name"]] + [[i, f"name_{i}"] for i in range(100)]
+        )
+        tbl = Table(source)
+        source.iterations = 0
+        table_map = self.mysql.evaluate_table(tbl)
+
+        self.assertEqual([c["type"] for c in table_map], ["smallint", "varchar"])
+        # The header is read once and the data is walked once (petl may open the
+        # source twice for that), no matter how many rows the table has.
+        self.assertLessEqual(source.iterations, 3)
+
+    def test_evaluate_table_ragged_rows(self):
+
+        tbl = Table([["ID", "Name"], [1], [2, "Jim", "extra"]])
+
+        table_map = [
+            {"name": "ID", "type": "smallint", "width": 0},
+            {"name": "Name", "type": "varchar", "width": 6},
+        ]
+        self.assertEqual(self.mysql.evaluate_table(tbl), table_map)
+
     def test_create_statement(self):
 
         stmt = "CREATE TABLE test_table ( \n id smallint \n,name varchar(10) \n,score float \n);"
         self.assertEqual(self.mysql.create_statement(self.tbl, "test_table"), stmt)
+
+    def test_insert_statement(self):
+
+        stmt = self.mysql._insert_statement(self.tbl, "test_table")
+        self.assertIn("(ID,Name,Score)", stmt)
+        self.assertTrue(stmt.endswith("VALUES (%s,%s,%s)"))
+
+    @patch("parsons.databases.mysql.create_table.petl.setheader", wraps=petl.setheader)
+    def test_create_statement_valid_columns(self, mock_setheader):
+
+        # Valid columns are left as is, without rewriting the table
+        tbl = Table([["id", "name"], [1, "Jim"]])
+        stmt = "CREATE TABLE test_table ( \n id smallint \n,name varchar(7) \n);"
+        self.assertEqual(self.mysql.create_statement(tbl, "test_table"), stmt)
+        mock_setheader.assert_not_called()
+
+        # Invalid columns are still renamed
+        self.mysql.create_statement(self.tbl, "test_table")
+        mock_setheader.assert_called_once()
+        self.assertEqual(self.tbl.columns, ["id", "name", "score"])
+
+    @patch("parsons.databases.mysql.mysql.mysql")
+    def test_table_exists(self, mock_mysql):
+
+        cursor = mock_mysql.connect.return_value.cursor.return_value
+        cursor.fetchone.return_value = (1,)
+        self.assertTrue(self.mysql.table_exists("my_schema.my_table"))
+        self.assertEqual(cursor.execute.call_args[0][1], ("my_schema", "my_table"))
+
+        cursor.fetchone.return_value = None
+        self.assertFalse(self.mysql.table_exists("my_table"))
+        self.assertEqual(cursor.execute.call_args[0][1], (None, "my_table"))
+
+    @patch("parsons.databases.mysql.mysql.mysql")
+    def test_copy(self, mock_mysql):
+
+        cursor = mock_mysql.connect.return_value.cursor.return_value
+        # The table already exists, so rows are appended without a create statement
+        cursor.fetchone.return_value = (1,)
+
+        tbl = Table(
+            [["id", "name"], [1, "Beatrice O'Brady"], [2, None], [3, "Jim"]]
+        )
+        self.mysql.copy(tbl, "test_table", if_exists="append", chunk_size=2)
+
+        # The table lookup reuses the copy's connection
+        mock_mysql.connect.assert_called_once()
+
+        calls = cursor.executemany.call_args_list
+        self.assertEqual(len(calls), 2)
+
+        sql = self.mysql._insert_statement(tbl, "test_table")
+        self.assertEqual([c[0][0] for c in calls], [sql, sql])
+        # DB-API executemany is only guaranteed to accept a sequence of rows
+        for c in calls:
+            self.assertIsInstance(c[0][1], (list, tuple))
+        self.assertEqual(
+            [[tuple(row) for row in c[0][1]] for c in calls],
+            [[(1, "Beatrice O'Brady"), (2, None)], [(3, "Jim")]],
+        )
+
+        # Run the first chunk through the driver's multi-row insert rewrite
+        stmt = self._batch_insert(*calls[0][0])
+        self.assertTrue(
+            stmt.endswith(b"VALUES (1,'Beatrice O\\'Brady'),(2,NULL)"), stmt
+        )
+
+    @patch("parsons.databases.mysql.mysql.mysql")
+    def test_copy_single_column(self, mock_mysql):
+
+        cursor = mock_mysql.connect.return_value.cursor.return_value
+        cursor.fetchone.return_value = (1,)
+
+        tbl = Table([["name"], ["Jim"], [None]])
+        self.mysql.copy(tbl, "test_table", if_exists="append")
+
+        sql, rows = cursor.executemany.call_args[0]
+        self.assertTrue(sql.endswith("VALUES (%s)"))
+        self.assertIsInstance(rows, (list, tuple))
+        self.assertEqual([tuple(row) for row in rows], [("Jim",), (None,)])
+        self.assertTrue(self._batch_insert(sql, rows).endswith(b"VALUES ('Jim'),(NULL)"))
+
+    @staticmethod
+    def _batch_insert(sql, rows):
+        # Build the statement the driver would send for ``executemany``, using a
+        # real cursor on a stub connection that only provides value conversion.
+        cursor = MySQLCursor.__new__(MySQLCursor)
+        cursor._connection = MagicMock(
+            python_charset="utf8", converter=MySQLConverter("utf8")
+        )
+        return cursor._batch_insert(sql, rows)